@@ -158,7 +158,8 @@ class AuthenticationManager:
             "selected_slide", "debug_logs", "condition_chosen",
             "use_personalisation", "consent_given", "consent_logged",
             "show_review", "gemini_chat", "_page_timer", "session_initialized",
-            "transcription_loaded", "slides_loaded", "gemini_chat_initialized"
+            "transcription_loaded", "slides_loaded", "gemini_chat_initialized",
+            "ueq_result", "form_data"
         ]
         
         for key in session_keys_to_clear:
@@ -394,22 +394,19 @@ elif st.session_state.current_page == "profile_survey":
                 weakest = st.session_state.get("challenging_subject", "")
                 prof_level = st.session_state.get("proficiency_level", "")
 
-                ratings = {s: st.session_state.get(s) for s in survey.subjects}
+                # Ratings come from the submitted form, not per-item state keys
+                form_data = st.session_state.get("form_data", {})
+                ratings = {
+                    s: form_data.get("ratings", {}).get(s) for s in survey.subjects
+                }
                 prio_ratings = {
-                    p: st.session_state.get(p) for p in survey.learning_priorities
+                    p: form_data.get("priority_ratings", {}).get(p)
+                    for p in survey.learning_priorities
                 }
-                sel_strats = [
-                    s for s in survey.learning_strategies if st.session_state.get(s)
-                ]
-                short_goals = [
-                    g for g in survey.short_term_goals if st.session_state.get(f"short_{g}")
-                ]
-                long_goals = [
-                    g for g in survey.long_term_goals if st.session_state.get(f"long_{g}")
-                ]
-                barriers = [
-                    b for b in survey.barriers if st.session_state.get(f"barrier_{b}")
-                ]
+                sel_strats = list(st.session_state.get("learning_strategies_sel", []))
+                short_goals = list(st.session_state.get("short_term_goals_sel", []))
+                long_goals = list(st.session_state.get("long_term_goals_sel", []))
+                barriers = list(st.session_state.get("barriers_sel", []))
 
                 profile_lines: List[str] = [
                     "Student Profile Survey Responses:",
@@ -930,8 +927,8 @@ elif st.session_state.current_page == "ueq_survey":
     else:
         # mark as completed once at least one answer present
         if any(
-            resp.get("value") is not None
-            for resp in st.session_state.get("responses", {}).values()
+            st.session_state.get(key) is not None
+            for key in testui_ueqsurvey.QUESTION_KEYS.values()
         ):
             st.session_state.ueq_completed = True
 
@@ -7,6 +7,7 @@ maintaining the exact same file structure and content as stored locally.
 
 import json
 import os
+import threading
 import streamlit as st
 from datetime import datetime
 from supabase import create_client
@@ -88,8 +89,13 @@ class SupabaseStorage:
             print(f"❌ SUPABASE INIT: {error_msg}")
             return False
     
-    def test_connection(self) -> bool:
-        """Test Supabase connection and upload capability."""
+    def test_connection(self, wait_for_cleanup: bool = False) -> bool:
+        """Test Supabase connection and upload capability.
+
+        The test file is removed on a background thread. Pass
+        ``wait_for_cleanup=True`` from short-lived processes so the removal
+        finishes before the interpreter exits.
+        """
         if not self.connected:
             return False
             
@@ -106,23 +112,52 @@ class SupabaseStorage:
             )
             
             if hasattr(test_result, 'error') and test_result.error:
-                error_msg = f"Upload test failed: {test_result.error}"
+                error_msg = self._describe_upload_test_error(test_result.error)
                 logger.error(error_msg)
                 print(f"❌ UPLOAD TEST: {error_msg}")
                 return False
                 
-            # Clean up test file
-            self.supabase.storage.from_(self.bucket_name).remove([test_path])
+            # Clean up test file in the background - the result is not needed
+            cleanup = threading.Thread(
+                target=self._remove_quietly, args=([test_path],), daemon=True
+            )
+            cleanup.start()
+            if wait_for_cleanup:
+                cleanup.join(timeout=30)
             logger.info("Upload test successful")
             print("✅ UPLOAD TEST: Upload capability confirmed")
             return True
             
         except Exception as e:
-            error_msg = f"Upload test failed: {e}"
+            error_msg = self._describe_upload_test_error(e)
             logger.error(error_msg)
             print(f"❌ UPLOAD TEST: {error_msg}")
             return False
     
+    def _describe_upload_test_error(self, error) -> str:
+        """Build the upload test failure message, calling out a missing bucket."""
+        error_text = str(error)
+        # storage3 raises StorageException with the API payload as its first
+        # argument, e.g. {"statusCode": "404", "error": ..., "message": ...}
+        payload = error.args[0] if isinstance(error, Exception) and error.args else error
+        if isinstance(payload, dict):
+            status = payload.get("statusCode", payload.get("status"))
+            message = f"{payload.get('error', '')} {payload.get('message', '')}"
+        else:
+            response = getattr(error, "response", None)
+            status = getattr(error, "status", getattr(response, "status_code", None))
+            message = str(getattr(error, "message", ""))
+        if str(status) == "404" and "Bucket not found" in message:
+            return f"Upload test failed: bucket '{self.bucket_name}' not found ({error_text})"
+        return f"Upload test failed: {error_text}"
+    
+    def _remove_quietly(self, paths) -> None:
+        """Remove files from the bucket, ignoring any failure."""
+        try:
+            self.supabase.storage.from_(self.bucket_name).remove(paths)
+        except Exception as e:
+            logger.warning(f"Could not remove upload test file: {e}")
+    
     def manual_test(self):
         """Manual test function you can call anytime to check Supabase setup."""
         print("\n" + "="*50)
@@ -142,8 +177,8 @@ class SupabaseStorage:
             print("❌ Bucket not ready")
             return False
         
-        # Test upload
-        if self.test_connection():
+        # Test upload; wait for the cleanup so no test file is left behind
+        if self.test_connection(wait_for_cleanup=True):
             print("✅ Upload capability confirmed")
             print("🎉 Supabase is ready for uploads!")
             return True
@@ -225,82 +260,81 @@ class SupabaseStorage:
             log_to_file_and_console(f"Starting upload for session {session_id}")
             log_to_file_and_console(f"Upload log saved to: {log_file}")
             
-            # Walk through all files in the session directory
-            all_files = list(session_dir.rglob("*"))
-            file_count = len([f for f in all_files if f.is_file()])
+            # Walk the session directory once and keep only regular files
+            session_files = [f for f in session_dir.rglob("*") if f.is_file()]
+            file_count = len(session_files)
             log_to_file_and_console(f"Found {file_count} files to process")
             
-            for file_path in session_dir.rglob("*"):
-                if file_path.is_file():
-                    # Calculate relative path from session directory
-                    relative_path = file_path.relative_to(session_dir)
-                    
-                    # Create credential-organized Supabase path: {credential_folder}/sessions/{session_id}/{relative_path}
-                    # Convert Windows paths to forward slashes for Supabase
-                    supabase_path = f"{folder_prefix}/sessions/{session_id}/{relative_path}".replace("\\", "/")
-                    
-                    # Get file size for debugging
-                    file_size = file_path.stat().st_size
-                    debug_info.append(f"{relative_path}: {file_size} bytes")
-                    
-                    log_to_file_and_console(f"Processing: {relative_path} ({file_size} bytes)")
-                    
-                    # Check file size (Supabase has limits)
-                    if file_size > 50 * 1024 * 1024:  # 50MB limit
-                        error_msg = f"{relative_path}: File too large ({file_size} bytes > 50MB)"
-                        failed_uploads.append(error_msg)
-                        log_to_file_and_console(f"❌ FAILED: {error_msg}")
-                        continue
+            for file_path in session_files:
+                # Calculate relative path from session directory
+                relative_path = file_path.relative_to(session_dir)
+                
+                # Create credential-organized Supabase path: {credential_folder}/sessions/{session_id}/{relative_path}
+                # Convert Windows paths to forward slashes for Supabase
+                supabase_path = f"{folder_prefix}/sessions/{session_id}/{relative_path}".replace("\\", "/")
+                
+                # Get file size for debugging
+                file_size = file_path.stat().st_size
+                debug_info.append(f"{relative_path}: {file_size} bytes")
+                
+                log_to_file_and_console(f"Processing: {relative_path} ({file_size} bytes)")
+                
+                # Check file size (Supabase has limits)
+                if file_size > 50 * 1024 * 1024:  # 50MB limit
+                    error_msg = f"{relative_path}: File too large ({file_size} bytes > 50MB)"
+                    failed_uploads.append(error_msg)
+                    log_to_file_and_console(f"❌ FAILED: {error_msg}")
+                    continue
+                
+                # Read file content
+                try:
+                    if file_path.suffix.lower() in ['.json', '.txt']:
+                        # Text files - read as UTF-8
+                        content = file_path.read_text(encoding='utf-8')
+                        content_type = "application/json" if file_path.suffix.lower() == '.json' else "text/plain"
+                        file_data = content.encode('utf-8')
+                    else:
+                        # Binary files
+                        content_type = "application/octet-stream"
+                        file_data = file_path.read_bytes()
                     
-                    # Read file content
+                    # Upload to Supabase
                     try:
-                        if file_path.suffix.lower() in ['.json', '.txt']:
-                            # Text files - read as UTF-8
-                            content = file_path.read_text(encoding='utf-8')
-                            content_type = "application/json" if file_path.suffix.lower() == '.json' else "text/plain"
-                            file_data = content.encode('utf-8')
-                        else:
-                            # Binary files
-                            content_type = "application/octet-stream"
-                            file_data = file_path.read_bytes()
+                        log_to_file_and_console(f"Uploading to: {supabase_path}")
                         
-                        # Upload to Supabase
-                        try:
-                            log_to_file_and_console(f"Uploading to: {supabase_path}")
-                            
-                            # Try upload first
-                            result = self.supabase.storage.from_(self.bucket_name).upload(
+                        # Try upload first
+                        result = self.supabase.storage.from_(self.bucket_name).upload(
+                            path=supabase_path,
+                            file=file_data,
+                            file_options={"content-type": content_type}
+                        )
+                        
+                        # If upload fails due to file existing, try update instead
+                        if hasattr(result, 'error') and result.error and "already exists" in str(result.error):
+                            log_to_file_and_console(f"File exists, trying update: {supabase_path}")
+                            result = self.supabase.storage.from_(self.bucket_name).update(
                                 path=supabase_path,
                                 file=file_data,
                                 file_options={"content-type": content_type}
                             )
-                            
-                            # If upload fails due to file existing, try update instead
-                            if hasattr(result, 'error') and result.error and "already exists" in str(result.error):
-                                log_to_file_and_console(f"File exists, trying update: {supabase_path}")
-                                result = self.supabase.storage.from_(self.bucket_name).update(
-                                    path=supabase_path,
-                                    file=file_data,
-                                    file_options={"content-type": content_type}
-                                )
-                            
-                            if hasattr(result, 'error') and result.error:
-                                error_msg = f"{relative_path}: {str(result.error)}"
-                                failed_uploads.append(error_msg)
-                                log_to_file_and_console(f"❌ FAILED: {error_msg}")
-                            else:
-                                uploaded_files.append(str(relative_path))
-                                log_to_file_and_console(f"✅ SUCCESS: {relative_path}")
-                                
-                        except Exception as upload_e:
-                            error_msg = f"{relative_path}: Upload exception - {str(upload_e)}"
+                        
+                        if hasattr(result, 'error') and result.error:
+                            error_msg = f"{relative_path}: {str(result.error)}"
                             failed_uploads.append(error_msg)
-                            log_to_file_and_console(f"❌ EXCEPTION: {error_msg}")
+                            log_to_file_and_console(f"❌ FAILED: {error_msg}")
+                        else:
+                            uploaded_files.append(str(relative_path))
+                            log_to_file_and_console(f"✅ SUCCESS: {relative_path}")
                             
-                    except Exception as file_e:
-                        error_msg = f"{relative_path}: File read error - {str(file_e)}"
+                    except Exception as upload_e:
+                        error_msg = f"{relative_path}: Upload exception - {str(upload_e)}"
                         failed_uploads.append(error_msg)
-                        log_to_file_and_console(f"❌ FILE ERROR: {error_msg}")
+                        log_to_file_and_console(f"❌ EXCEPTION: {error_msg}")
+                        
+                except Exception as file_e:
+                    error_msg = f"{relative_path}: File read error - {str(file_e)}"
+                    failed_uploads.append(error_msg)
+                    log_to_file_and_console(f"❌ FILE ERROR: {error_msg}")
             
             # Report results
             log_to_file_and_console(f"Upload complete: {len(uploaded_files)} success, {len(failed_uploads)} failed")
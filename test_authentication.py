@@ -92,10 +92,7 @@ def test_authentication_system():
     }
     
     for username, expected_features in feature_tests.items():
-        config = auth_manager.authenticate(username, auth_manager.credentials[username].password_hash.replace(
-            auth_manager._hash_password(""), ""
-        ))
-        # Note: We can't easily reverse the hash, so we'll use the stored config directly
+        # Authentication itself is covered by test 2; inspect the stored config directly
         config = auth_manager.credentials[username]
         
         print(f"✅ {username}:")
@@ -1,59 +1,143 @@
 import os
+import sys
 
+import numpy as np
 import streamlit as st
 from session_manager import get_session_manager
 
 session_manager = get_session_manager()
 
+# The 26 question pairs from the actual UEQ: (number, left, right)
+QUESTIONS = (
+    (1, "annoying", "enjoyable"),
+    (2, "not understandable", "understandable"),
+    (3, "creative", "dull"),
+    (4, "easy to learn", "difficult to learn"),
+    (5, "valuable", "inferior"),
+    (6, "boring", "exciting"),
+    (7, "not interesting", "interesting"),
+    (8, "unpredictable", "predictable"),
+    (9, "fast", "slow"),
+    (10, "inventive", "conventional"),
+    (11, "obstructive", "supportive"),
+    (12, "good", "bad"),
+    (13, "complicated", "easy"),
+    (14, "unlikable", "pleasing"),
+    (15, "usual", "leading edge"),
+    (16, "unpleasant", "pleasant"),
+    (17, "secure", "not secure"),
+    (18, "motivating", "demotivating"),
+    (19, "meets expectations", "does not meet expectations"),
+    (20, "inefficient", "efficient"),
+    (21, "clear", "confusing"),
+    (22, "impractical", "practical"),
+    (23, "organized", "cluttered"),
+    (24, "attractive", "unattractive"),
+    (25, "friendly", "unfriendly"),
+    (26, "conservative", "innovative"),
+)
+
+# Widget / session-state key of each question
+QUESTION_KEYS = {number: sys.intern(f"q{number}") for number, _, _ in QUESTIONS}
+
+# UEQ scale definitions
+SCALES = {
+    "Attractiveness": (1, 12, 14, 16, 24, 25),
+    "Perspicuity": (2, 4, 13, 21),
+    "Efficiency": (9, 20, 22, 23),
+    "Dependability": (8, 11, 17, 19),
+    "Stimulation": (5, 6, 7, 18),
+    "Novelty": (3, 10, 15, 26),
+}
+
+# UEQ benchmark values (mean, standard deviation)
+BENCH = {
+    "Attractiveness": (1.50, 0.85),
+    "Perspicuity": (1.45, 0.83),
+    "Efficiency": (1.38, 0.79),
+    "Dependability": (1.25, 0.86),
+    "Stimulation": (1.17, 0.96),
+    "Novelty": (0.78, 0.96),
+}
+
+SCALE_NAMES = tuple(SCALES)
+NUM_QUESTIONS = sum(len(items) for items in SCALES.values())
+GRADE_LABELS = ("weak", "okay", "good", "excellent")
+
 # ---- UEQ CALCULATION FUNCTION ------
+def _scoring_tables() -> tuple:
+    """Build the lookups evaluate_ueq needs.
+
+    Returns the scale index of each question (position 0 is question 1), the
+    number of questions per scale and the grade cut-offs per scale (benchmark
+    mean -0.5 SD, mean, +0.5 SD). main.py reloads this module on every run, so
+    the tables are built here, on submit, rather than at module level.
+    """
+    dim_index = np.empty(NUM_QUESTIONS, dtype=np.intp)
+    for dim, items in enumerate(SCALES.values()):
+        dim_index[np.asarray(items) - 1] = dim
+    dim_count = np.bincount(dim_index, minlength=len(SCALE_NAMES))
+
+    bench_mean, bench_sd = np.array([BENCH[scale] for scale in SCALE_NAMES]).T
+    thresholds = np.stack(
+        [bench_mean - 0.5 * bench_sd, bench_mean, bench_mean + 0.5 * bench_sd],
+        axis=1,
+    )
+    return dim_index, dim_count, thresholds
+
+def _scale_means(vals: np.ndarray, dim_index: np.ndarray, dim_count: np.ndarray) -> np.ndarray:
+    """Average raw 1-7 scores into the six scale means on the −3 … +3 interval.
+
+    The Likert-to-interval shift (score - 4) is folded into the per-scale sums.
+    """
+    sums = np.bincount(dim_index, weights=vals, minlength=len(SCALE_NAMES))
+    return (sums - 4 * dim_count) / dim_count
+
 def evaluate_ueq(raw: dict) -> dict:
-    """Evaluate UEQ scores based on the raw responses.
+    """Evaluate UEQ scores based on the raw responses (question number → 1-7).
     Returns dictionary with 'means' and 'grades' keys for session_manager.save_ueq().
     """
-    # UEQ scale definitions
-    SCALES = {
-        "Attractiveness": [1, 12, 14, 16, 24, 25],
-        "Perspicuity": [2, 4, 13, 21],
-        "Efficiency": [9, 20, 22, 23],
-        "Dependability": [8, 11, 17, 19],
-        "Stimulation": [5, 6, 7, 18],
-        "Novelty": [3, 10, 15, 26],
-    }
-    
-    # UEQ benchmark values (mean, standard deviation)
-    BENCH = {
-        "Attractiveness": (1.50, 0.85),
-        "Perspicuity": (1.45, 0.83),
-        "Efficiency": (1.38, 0.79),
-        "Dependability": (1.25, 0.86),
-        "Stimulation": (1.17, 0.96),
-        "Novelty": (0.78, 0.96),
-    }
-    
-    def to_interval(score: int) -> int:
-        """Convert 1-7 Likert to −3 … +3."""
-        return score - 4
-    
-    def grade(mean: float, bench_mean: float, sd: float) -> str:
-        """Grade the mean against benchmark."""
-        if mean >= bench_mean + 0.5 * sd:
-            return "excellent"
-        if mean >= bench_mean:
-            return "good"
-        if mean >= bench_mean - 0.5 * sd:
-            return "okay"
-        return "weak"
-    
-    # Calculate means and grades for each scale
+    # Calculate means and grades for each scale in one vectorised pass
+    vals = np.fromiter(
+        (raw[n] for n in range(1, NUM_QUESTIONS + 1)),
+        dtype=np.int8,
+        count=NUM_QUESTIONS,
+    )
+    dim_index, dim_count, thresholds = _scoring_tables()
+    scale_means = _scale_means(vals, dim_index, dim_count)
+    # The number of cut-offs a scale mean reaches indexes into GRADE_LABELS
+    grade_index = (scale_means[:, None] >= thresholds).sum(axis=1)
+
     means, grades = {}, {}
-    for scale, items in SCALES.items():
-        vals = [to_interval(raw[f"q{n}"]) for n in items]
-        m = sum(vals) / len(vals)
+    for scale, m, g in zip(SCALE_NAMES, scale_means.tolist(), grade_index.tolist()):
         means[scale] = m
-        grades[scale] = grade(m, *BENCH[scale])
+        grades[scale] = GRADE_LABELS[g]
     
     return {"means": means, "grades": grades}
 
+def build_response_text(answers: dict) -> str:
+    """Format the submitted answers (question number → 1-7) as plain text."""
+    response_lines = ["User Experience Questionnaire Responses:", "=" * 50, ""]
+    for number, left, right in QUESTIONS:
+        response_lines.append(f"{number}. {left} --- {right}: {answers[number]}/7")
+    return "\n".join(response_lines) + "\n"
+
+# ---- UEQ STYLING ------
+UEQ_CSS = """
+<style>
+.question-container {
+    margin-bottom: 20px;
+    padding: 10px;
+    border-left: 3px solid #0E4B99;
+    background-color: #f0f2f6;
+}
+.question-divider {
+    margin: 10px 0;
+    border-bottom: 1px solid #e0e0e0;
+}
+</style>
+"""
+
 st.title("User Experience Questionnaire")
 
 st.markdown(
@@ -70,103 +154,52 @@ Please remember: there is no wrong or right answer!
 """
 )
 
-# Dictionary to store responses
-if "responses" not in st.session_state:
-    st.session_state.responses = {}
-
 # CSS for styling
-st.markdown(
-    """
-<style>
-.question-container {
-    margin-bottom: 20px;
-    padding: 10px;
-    border-left: 3px solid #0E4B99;
-    background-color: #f0f2f6;
-}
-.question-divider {
-    margin: 10px 0;
-    border-bottom: 1px solid #e0e0e0;
-}
-</style>
-""",
-    unsafe_allow_html=True,
-)
-
-# The 26 question pairs from the actual UEQ
-questions = [
-    {"number": 1, "left": "annoying", "right": "enjoyable"},
-    {"number": 2, "left": "not understandable", "right": "understandable"},
-    {"number": 3, "left": "creative", "right": "dull"},
-    {"number": 4, "left": "easy to learn", "right": "difficult to learn"},
-    {"number": 5, "left": "valuable", "right": "inferior"},
-    {"number": 6, "left": "boring", "right": "exciting"},
-    {"number": 7, "left": "not interesting", "right": "interesting"},
-    {"number": 8, "left": "unpredictable", "right": "predictable"},
-    {"number": 9, "left": "fast", "right": "slow"},
-    {"number": 10, "left": "inventive", "right": "conventional"},
-    {"number": 11, "left": "obstructive", "right": "supportive"},
-    {"number": 12, "left": "good", "right": "bad"},
-    {"number": 13, "left": "complicated", "right": "easy"},
-    {"number": 14, "left": "unlikable", "right": "pleasing"},
-    {"number": 15, "left": "usual", "right": "leading edge"},
-    {"number": 16, "left": "unpleasant", "right": "pleasant"},
-    {"number": 17, "left": "secure", "right": "not secure"},
-    {"number": 18, "left": "motivating", "right": "demotivating"},
-    {"number": 19, "left": "meets expectations", "right": "does not meet expectations"},
-    {"number": 20, "left": "inefficient", "right": "efficient"},
-    {"number": 21, "left": "clear", "right": "confusing"},
-    {"number": 22, "left": "impractical", "right": "practical"},
-    {"number": 23, "left": "organized", "right": "cluttered"},
-    {"number": 24, "left": "attractive", "right": "unattractive"},
-    {"number": 25, "left": "friendly", "right": "unfriendly"},
-    {"number": 26, "left": "conservative", "right": "innovative"},
-]
-
-# Display each question with improved layout
-for q in questions:
-    # Create three columns for better layout
-    col_left, col_scale, col_right = st.columns([1, 3, 1])
-
-    with col_left:
-        st.markdown(
-            f"<div style='text-align: right;'>{q['left']}</div>",
-            unsafe_allow_html=True,
-        )
+st.markdown(UEQ_CSS, unsafe_allow_html=True)
+
+# The 26 radios are batched in a form so picking a value does not rerun the
+# page; responses are only sent to the script on submit
+with st.form("ueq_form"):
+    # Display each question with improved layout
+    for number, left, right in QUESTIONS:
+        # Create three columns for better layout
+        col_left, col_scale, col_right = st.columns([1, 3, 1])
+
+        with col_left:
+            st.markdown(
+                f"<div style='text-align: right;'>{left}</div>",
+                unsafe_allow_html=True,
+            )
 
-    with col_scale:
-        # Create the radio buttons
-        key = f"q{q['number']}"
-        selected_value = st.radio(
-            f"Select a value for question {q['number']}",
-            options=list(range(1, 8)),
-            horizontal=True,
-            key=key,
-            label_visibility="collapsed",
-            index=None,
-        )
+        with col_scale:
+            # Create the radio buttons
+            # The selected value is read back from st.session_state[f"q{n}"]
+            st.radio(
+                f"Select a value for question {number}",
+                options=list(range(1, 8)),
+                horizontal=True,
+                key=QUESTION_KEYS[number],
+                label_visibility="collapsed",
+                index=None,
+            )
 
-    with col_right:
-        st.markdown(
-            f"<div style='text-align: left;'>{q['right']}</div>", unsafe_allow_html=True
-        )
+        with col_right:
+            st.markdown(
+                f"<div style='text-align: left;'>{right}</div>", unsafe_allow_html=True
+            )
 
-    # Store the response
-    st.session_state.responses[key] = {
-        "question": f"{q['left']} --- {q['right']}",
-        "value": selected_value,
-    }
+        # Add a subtle divider between questions
+        st.markdown("<div class='question-divider'></div>", unsafe_allow_html=True)
 
-    # Add a subtle divider between questions
-    st.markdown("<div class='question-divider'></div>", unsafe_allow_html=True)
+    # Submit button
+    submitted = st.form_submit_button("Submit Responses")
 
-# Submit button
-if st.button("Submit Responses"):
+if submitted:
     # list any questions without a value
     missing = [
-        str(q["number"])
-        for q in questions
-        if st.session_state.responses[f"q{q['number']}"]["value"] is None
+        str(number)
+        for number, _, _ in QUESTIONS
+        if st.session_state.get(QUESTION_KEYS[number]) is None
     ]
 
     if missing:
@@ -183,31 +216,25 @@ if st.button("Submit Responses"):
     st.session_state["ueq_submitted"] = True
 
     answers_dict = {
-        key: entry["value"]  # 1‑7 scale value
-        for key, entry in st.session_state.responses.items()
+        number: st.session_state[QUESTION_KEYS[number]]  # 1‑7 scale value
+        for number, _, _ in QUESTIONS
     }
 
-    response_text = "User Experience Questionnaire Responses:\n"
-    response_text += "=" * 50 + "\n\n"
-
-    for q in questions:
-        key = f"q{q['number']}"
-        value = st.session_state.responses[key]["value"]
-        response_text += f"{q['number']}. {q['left']} --- {q['right']}: {value}/7\n"
+    response_text = build_response_text(answers_dict)
 
     # Display the responses
     st.text_area("Your Responses:", value=response_text, height=400)
 
-    # Import the session manager
-    from session_manager import get_session_manager
-
-    # Get or create a session manager instance
-    session_manager = get_session_manager()
-
     bench = evaluate_ueq(answers_dict)
+    # save_ueq stores answers under their "q<n>" widget keys
+    saved_answers = {
+        QUESTION_KEYS[number]: value for number, value in answers_dict.items()
+    }
+    # Kept so a later comment can be added without rebuilding the results
+    st.session_state["ueq_result"] = (saved_answers, bench)
 
     txt_path = session_manager.save_ueq(
-        answers=answers_dict,
+        answers=saved_answers,
         benchmark=bench,
         free_text=st.session_state.get("saved_comment"),  # ← not "extra_comment"
     )
@@ -218,38 +245,45 @@ if st.button("Submit Responses"):
 
     st.success(f"Your responses have been saved with pseudonymized ID: {fake_name}")
 
-st.markdown("#### Extra comment")
-# --- comment widget -----------------------------------------
-comment_txt = st.text_area(
-    "Anything else you would like to share?",
-    placeholder="Feel free to note technical issues, UI feedback, ideas, specific notes, etc.",
-    key="extra_comment",
-    height=120,
+# Streamlit 1.33 added scoped reruns as st.experimental_fragment (later
+# st.fragment); on older versions the section simply reruns with the page
+_fragment = getattr(st, "fragment", None) or getattr(
+    st, "experimental_fragment", lambda func: func
 )
 
-# --- save comment widget -----------------------------------
-if st.button("Save comment", key="save_extra_comment"):
-    if comment_txt.strip():
-        st.session_state["saved_comment"] = comment_txt.strip()
-        
-        # If UEQ has already been submitted, re-save it with the new comment
-        if "ueq_submitted" in st.session_state and st.session_state["ueq_submitted"]:
-            # Re-create the answers dict and benchmark
-            answers_dict = {
-                key: entry["value"]
-                for key, entry in st.session_state.responses.items()
-                if entry["value"] is not None
-            }
-            bench = evaluate_ueq(answers_dict)
-            
-            # Re-save UEQ with the new comment
-            txt_path = session_manager.save_ueq(
-                answers=answers_dict,
-                benchmark=bench,
-                free_text=st.session_state.get("saved_comment"),
-            )
-            st.success("Your comment has been saved and added to your UEQ responses!")
+@_fragment
+def comment_section():
+    """Extra comment box; typing or saving only reruns this section."""
+    st.markdown("#### Extra comment")
+    # --- comment widget -----------------------------------------
+    comment_txt = st.text_area(
+        "Anything else you would like to share?",
+        placeholder="Feel free to note technical issues, UI feedback, ideas, specific notes, etc.",
+        key="extra_comment",
+        height=120,
+    )
+
+    # --- save comment widget -----------------------------------
+    if st.button("Save comment", key="save_extra_comment"):
+        if comment_txt.strip():
+            st.session_state["saved_comment"] = comment_txt.strip()
+
+            # If UEQ has already been submitted, re-save it with the new comment
+            # using the answers and scores stored at submit time
+            ueq_result = st.session_state.get("ueq_result")
+            if st.session_state.get("ueq_submitted") and ueq_result:
+                saved_answers, bench = ueq_result
+
+                # Re-save UEQ with the new comment
+                txt_path = session_manager.save_ueq(
+                    answers=saved_answers,
+                    benchmark=bench,
+                    free_text=st.session_state.get("saved_comment"),
+                )
+                st.success("Your comment has been saved and added to your UEQ responses!")
+            else:
+                st.success("Your comment has been saved!")
         else:
-            st.success("Your comment has been saved!")
-    else:
-        st.warning("Please enter a comment before saving.")
\ No newline at end of file
+            st.warning("Please enter a comment before saving.")
+
+comment_section()